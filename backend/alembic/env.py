@@ -3,14 +3,11 @@ from __future__ import annotations
 import sys, pkgutil, importlib
 from logging.config import fileConfig
 from alembic import context
-from sqlalchemy import engine_from_config, pool, text
-from app.config import settings
+from sqlalchemy import engine_from_config, pool
 
-# --- Load .env and make sure we can import app.* ---
+# --- Make sure we can import app.* (.env is loaded by app.config) ---
 from pathlib import Path
-from dotenv import load_dotenv
 BACKEND_ROOT = Path(__file__).resolve().parents[1]
-load_dotenv(BACKEND_ROOT / ".env")
 if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
@@ -18,6 +15,7 @@ if str(BACKEND_ROOT) not in sys.path:
 config = context.config
 
 # --- Import settings and OVERRIDE the URL BEFORE engine_from_config ---
+from app.config import settings
 config.set_main_option("sqlalchemy.url", settings.alembic_database_url)
 
 # Optional: log where Alembic thinks it will connect
@@ -29,14 +27,11 @@ if config.config_file_name is not None:
 
 # --- Import Base and models so autogenerate can see them ---
 from app.db import Base
-try:
-    import app.models as models_pkg  # noqa: F401
-    pkg_path = BACKEND_ROOT / "app" / "models"
-    if pkg_path.exists():
-        for m in pkgutil.iter_modules([str(pkg_path)]):
-            importlib.import_module(f"app.models.{m.name}")
-except Exception:
-    pass
+import app.models as models_pkg  # noqa: F401
+# Only walk submodules if app.models ever becomes a package
+if hasattr(models_pkg, "__path__"):
+    for m in pkgutil.iter_modules(models_pkg.__path__):
+        importlib.import_module(f"app.models.{m.name}")
 
 target_metadata = Base.metadata
 
@@ -56,14 +51,22 @@ def run_migrations_online() -> None:
     connectable = engine_from_config(
         config.get_section(config.config_ini_section),
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+        # Small reusable pool: with transaction_per_migration=True each revision
+        # opens its own transaction, so reuse the connection instead of reconnecting.
+        poolclass=pool.QueuePool,
+        pool_size=5,
+        max_overflow=5,
+        pool_pre_ping=True,
+        pool_recycle=3600,
     )
 
     with connectable.connect() as connection:
-        # Force schema to public (belt & suspenders)
-        connection.execute(text("SET search_path TO public"))
-        connection.execute(text("CREATE SCHEMA IF NOT EXISTS public"))
-        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pgcrypto"))
+        # Force schema to public (belt & suspenders), in one round trip
+        connection.exec_driver_sql(
+            "CREATE SCHEMA IF NOT EXISTS public; "
+            "SET search_path TO public; "
+            "CREATE EXTENSION IF NOT EXISTS pgcrypto;"
+        )
 
         context.configure(
             connection=connection,
@@ -78,6 +81,8 @@ def run_migrations_online() -> None:
         with context.begin_transaction():
             context.run_migrations()
 
+    connectable.dispose()
+
 
 if context.is_offline_mode():
     run_migrations_offline()
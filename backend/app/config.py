@@ -7,22 +7,20 @@ Adds both async (app) and sync (alembic) DB URLs for a clean Postgres setup.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import List
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, List, Tuple
+from pydantic import field_validator, model_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 from dotenv import load_dotenv
 import os
 
-# Resolve the backend root and load .env explicitly so it works regardless of CWD
+# Resolve the backend root and load .env explicitly so it works regardless of CWD.
+# Only in dev: deployed environments inject real env vars, so skip reading the file there.
 BACKEND_ROOT = Path(__file__).resolve().parents[1]
 ENV_PATH = BACKEND_ROOT / ".env"
-load_dotenv(dotenv_path=ENV_PATH)
-
-def _env_bool(name: str, default: bool) -> bool:
-    val = os.getenv(name)
-    if val is None:
-        return default
-    return val.strip().lower() in {"1", "true", "yes", "y", "on"}
+if os.getenv("APP_ENV", "dev") == "dev" and ENV_PATH.is_file():
+    load_dotenv(dotenv_path=ENV_PATH)
 
 def _ensure_asyncpg(url: str) -> str:
     """
@@ -46,10 +44,13 @@ def _ensure_sync_psycopg(url: str) -> str:
         return url.replace("postgresql+asyncpg://", "postgresql://", 1)
     return url
 
-class Settings(BaseModel):
+class Settings(BaseSettings):
     """
     Settings model for application configuration.
 
+    Values are read from the process environment (populated from .env above)
+    in a single pass; field names map case-insensitively to env var names.
+
     Attributes:
         app_env (str): Application environment (e.g., 'dev', 'prod').
         app_host (str): Host to bind the FastAPI server.
@@ -57,6 +58,8 @@ class Settings(BaseModel):
 
         database_url (str): Async SQLAlchemy URL for the app (e.g., postgresql+asyncpg://...).
         alembic_database_url (str): Sync SQLAlchemy URL for Alembic (e.g., postgresql://...).
+        db_pool_warm_size (int): Connections to open at startup (0 disables warm-up).
+        db_statement_cache_size (int): asyncpg prepared statement cache size (0 for PgBouncer).
 
         ollama_host (str): Base URL for the local Ollama server.
         llm_model (str): Model name served by Ollama for QA/summarization.
@@ -71,53 +74,76 @@ class Settings(BaseModel):
         faiss_index (str): FAISS index type identifier (e.g., 'FlatIP').
         qa_top_k (int): Number of chunks to retrieve for QA.
 
-        cors_allowed_origins (List[str]): Allowed origins for CORS.
+        cors_allowed_origins (Tuple[str, ...]): Allowed origins for CORS.
         log_level (str): Logging verbosity (e.g., 'INFO', 'DEBUG').
 
         enable_diarization (bool): Feature flag for speaker diarization.
         enable_code_switch_tagging (bool): Feature flag to tag per-utterance language.
+
+        ingest_debug_dump (str): If set, path template for raw per-connection audio dumps.
     """
-    app_env: str = os.getenv("APP_ENV", "dev")
-    app_host: str = os.getenv("APP_HOST", "127.0.0.1")
-    app_port: int = int(os.getenv("APP_PORT", "8000"))
+    # env_ignore_empty: blank values (e.g. `DB_POOL_WARM_SIZE=`) fall back to defaults
+    model_config = SettingsConfigDict(case_sensitive=False, extra="ignore", env_ignore_empty=True)
+
+    app_env: str = "dev"
+    app_host: str = "127.0.0.1"
+    app_port: int = 8000
 
     # App URL (async for runtime)
-    database_url: str = os.getenv("DATABASE_URL", "sqlite:///./local.db")
+    database_url: str = "sqlite:///./local.db"
 
     # Alembic URL (sync for migrations)
-    alembic_database_url: str = os.getenv("ALEMBIC_DATABASE_URL", "")
+    alembic_database_url: str = ""
+
+    # Connections opened at startup to warm the pool
+    db_pool_warm_size: int = 5
 
-    ollama_host: str = os.getenv("OLLAMA_HOST", "http://127.0.0.1:11434")
-    llm_model: str = os.getenv("LLM_MODEL", "llama3.1:8b-instruct-q4_K_M")
+    # asyncpg prepared statement cache; must be 0 behind PgBouncer
+    db_statement_cache_size: int = 1024
 
-    asr_model: str = os.getenv("ASR_MODEL", "large-v3")
-    asr_device: str = os.getenv("ASR_DEVICE", "cuda")
-    asr_compute_type: str = os.getenv("ASR_COMPUTE_TYPE", "float16")
+    ollama_host: str = "http://127.0.0.1:11434"
+    llm_model: str = "llama3.1:8b-instruct-q4_K_M"
 
-    vad_mode: int = int(os.getenv("VAD_MODE", "2"))
+    asr_model: str = "large-v3"
+    asr_device: str = "cuda"
+    asr_compute_type: str = "float16"
 
-    embedding_model: str = os.getenv("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
-    faiss_index: str = os.getenv("FAISS_INDEX", "FlatIP")
-    qa_top_k: int = int(os.getenv("QA_TOP_K", "8"))
+    vad_mode: int = 2
 
-    cors_allowed_origins: List[str] = Field(default_factory=list)
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    faiss_index: str = "FlatIP"
+    qa_top_k: int = 8
 
-    enable_diarization: bool = _env_bool("ENABLE_DIARIZATION", False)
-    enable_code_switch_tagging: bool = _env_bool("ENABLE_CODE_SWITCH_TAGGING", True)
+    # NoDecode: the env value is a CSV string, not JSON
+    cors_allowed_origins: Annotated[Tuple[str, ...], NoDecode] = ()
+    log_level: str = "INFO"
+
+    enable_diarization: bool = False
+    enable_code_switch_tagging: bool = True
+
+    # Debug: dump raw ingested audio (empty disables)
+    ingest_debug_dump: str = ""
 
     @field_validator("cors_allowed_origins", mode="before")
     @classmethod
-    def _parse_origins(cls, v: str | List[str]) -> List[str]:
+    def _parse_origins(cls, v: str | List[str] | Tuple[str, ...]) -> Tuple[str, ...]:
+        """
+        Parse a comma-separated list of origins from the raw input value.
+        """
+        if isinstance(v, str):
+            return tuple(x for x in (s.strip() for s in v.split(",")) if x)
+        return tuple(v)
+
+    @field_validator("enable_diarization", "enable_code_switch_tagging", mode="before")
+    @classmethod
+    def _parse_flag(cls, v: str | bool) -> bool:
         """
-        Parse a comma-separated list of origins from the environment variable.
+        Treat "1", "true", "yes", "y" and "on" (any case) as enabled;
+        any other string disables the flag.
         """
-        if isinstance(v, list):
-            return v
-        raw = os.getenv("CORS_ALLOWED_ORIGINS", "").strip()
-        if not raw:
-            return []
-        return [item.strip() for item in raw.split(",") if item.strip()]
+        if isinstance(v, str):
+            return v.strip().lower() in {"1", "true", "yes", "y", "on"}
+        return v
 
     @field_validator("vad_mode")
     @classmethod
@@ -136,17 +162,24 @@ class Settings(BaseModel):
         """
         return _ensure_asyncpg(v)
 
-    @field_validator("alembic_database_url")
-    @classmethod
-    def _normalize_alembic_db_url(cls, v: str) -> str:
+    @model_validator(mode="after")
+    def _normalize_alembic_db_url(self) -> "Settings":
         """
         Ensure Alembic DB URL uses sync driver for Postgres.
         If not provided, derive from database_url.
         """
-        if not v:
-            # derive from the async database_url if possible
-            base = os.getenv("DATABASE_URL", "sqlite:///./local.db")
-            return _ensure_sync_psycopg(base)
-        return _ensure_sync_psycopg(v)
+        self.alembic_database_url = _ensure_sync_psycopg(
+            self.alembic_database_url or self.database_url
+        )
+        return self
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the process-wide Settings instance (env is parsed once).
+    """
+    return Settings()
+
 
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
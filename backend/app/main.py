@@ -1,22 +1,29 @@
 """
 FastAPI application entry point.
 
+- Configures logging from LOG_LEVEL
 - Wires routers
 - Uses async DB (managed via dependencies inside routers)
+- Warms the DB connection pool on startup
 - Schema is managed by Alembic; no create_all() here
+- ORM models are imported lazily (see __getattr__ below)
 """
 
+import logging
+
 from fastapi import FastAPI
 from .config import settings
-from . import models  # keep if your routers import models indirectly
+from .db import warm_connection_pool
 from .routers.health import router as health_router
-from .ws.ingest import router as ws_router
+from .ws.ingest import router as ws_router, start_dump_writer, stop_dump_writer
 
 
 def create_app() -> FastAPI:
     """
     Create and configure the FastAPI application.
     """
+    logging.basicConfig(level=settings.log_level.upper())
+
     app = FastAPI(
         title="Meeting Assistant API",
         version="0.1.0",
@@ -24,6 +31,13 @@ def create_app() -> FastAPI:
         redoc_url="/redoc",
     )
 
+    async def _warm_db_pool() -> None:
+        await warm_connection_pool(settings.db_pool_warm_size)
+
+    app.add_event_handler("startup", _warm_db_pool)
+    app.add_event_handler("startup", start_dump_writer)
+    app.add_event_handler("shutdown", stop_dump_writer)
+
     # Routers
     app.include_router(health_router)
     app.include_router(ws_router)
@@ -34,4 +48,18 @@ def create_app() -> FastAPI:
 # IMPORTANT: Alembic owns schema migrations now.
 # Do NOT call Base.metadata.create_all(bind=engine).
 
-app = create_app()
\ No newline at end of file
+app = create_app()
+
+
+def __getattr__(name: str):
+    """
+    Lazily expose `app.main.models` (PEP 562).
+
+    Alembic owns the schema, so ORM models only need importing when something
+    actually uses them; routers should import them at call-site.
+    """
+    if name == "models":
+        from . import models as _models
+        globals()["models"] = _models
+        return _models
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
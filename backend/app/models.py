@@ -3,25 +3,47 @@ ORM model definitions for core entities (Postgres-native).
 
 - UUID primary keys (server-generated via gen_random_uuid())
 - TIMESTAMPTZ for timestamps
+- Generic Uuid/DateTime types: native UUID/TIMESTAMPTZ on Postgres, no
+  dialect-specific imports (so SQLite dev mode works too)
+- Server defaults compile per dialect (now() / CURRENT_TIMESTAMP, see gen_random_uuid)
 - BIGINT for millisecond offsets
 - CASCADE delete from meetings -> utterances
 """
 
 from datetime import datetime
-from sqlalchemy import String, Text, ForeignKey, BigInteger, Boolean, text as sa_text
-from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP
+from sqlalchemy import String, Text, ForeignKey, BigInteger, Boolean, DateTime, Uuid, func, text as sa_text
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import relationship, Mapped, mapped_column
+from sqlalchemy.sql.expression import FunctionElement
 from .db import Base
 
+class gen_random_uuid(FunctionElement):
+    """
+    Server-side UUID default: gen_random_uuid() on Postgres, and a random
+    32-hex-digit value (the generic Uuid storage format) on SQLite dev DBs.
+    """
+    type = Uuid(as_uuid=False)
+    inherit_cache = True
+
+
+@compiles(gen_random_uuid)
+def _gen_random_uuid_default(element, compiler, **kw) -> str:
+    return "gen_random_uuid()"
+
+
+@compiles(gen_random_uuid, "sqlite")
+def _gen_random_uuid_sqlite(element, compiler, **kw) -> str:
+    return "lower(hex(randomblob(16)))"
+
 
 class Meeting(Base):
     __tablename__ = "meetings"
 
     # Keep Python type as str (uuid stored in DB)
     id: Mapped[str] = mapped_column(
-        UUID(as_uuid=False),
+        Uuid(as_uuid=False),
         primary_key=True,
-        server_default=sa_text("gen_random_uuid()"),
+        server_default=gen_random_uuid(),
     )
 
     title: Mapped[str] = mapped_column(String(255), nullable=False, default="Untitled Meeting")
@@ -29,12 +51,12 @@ class Meeting(Base):
 
     # timezone-aware timestamps
     start_ts: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True),
+        DateTime(timezone=True),
         nullable=False,
-        server_default=sa_text("now()"),
+        server_default=func.now(),
     )
     end_ts: Mapped[datetime | None] = mapped_column(
-        TIMESTAMP(timezone=True),
+        DateTime(timezone=True),
         nullable=True,
     )
 
@@ -50,13 +72,13 @@ class Utterance(Base):
     __tablename__ = "utterances"
 
     id: Mapped[str] = mapped_column(
-        UUID(as_uuid=False),
+        Uuid(as_uuid=False),
         primary_key=True,
-        server_default=sa_text("gen_random_uuid()"),
+        server_default=gen_random_uuid(),
     )
 
     meeting_id: Mapped[str] = mapped_column(
-        UUID(as_uuid=False),
+        Uuid(as_uuid=False),
         ForeignKey("meetings.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -74,7 +96,7 @@ class Utterance(Base):
     # streaming/finality + audit
     is_final: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=sa_text("false"))
     created_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), nullable=False, server_default=sa_text("now()")
+        DateTime(timezone=True), nullable=False, server_default=func.now()
     )
 
     meeting = relationship("Meeting", back_populates="utterances")
\ No newline at end of file
@@ -1,20 +1,62 @@
 """
-Healthcheck endpoint for service monitoring.
+Healthcheck endpoints for service monitoring.
 
-- /health/ready: verifies API is up and DB is reachable.
+- /health/live: liveness; the process is up (no DB access).
+- /health/ready: readiness; verifies API is up and DB is reachable.
 """
 
-from fastapi import APIRouter, Depends
+import asyncio
+import time
+
+from fastapi import APIRouter
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.db import get_db
+from app.db import get_engine
 
 router = APIRouter(prefix="/health", tags=["health"])
 
+# How long a successful DB probe is reused for burst readiness checks
+_READY_CACHE_SECONDS = 1.0
+
+
+class _Probe:
+    """
+    Coalesces readiness checks: a successful `SELECT 1` is reused for
+    `_READY_CACHE_SECONDS`, and concurrent callers share one in-flight probe.
+    """
+
+    def __init__(self) -> None:
+        self.last_ok_ts = float("-inf")
+        self._lock = asyncio.Lock()
+
+    def _fresh(self) -> bool:
+        return time.monotonic() - self.last_ok_ts < _READY_CACHE_SECONDS
+
+    async def check(self) -> None:
+        if self._fresh():
+            return
+        async with self._lock:
+            if self._fresh():
+                return
+            async with get_engine().connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            self.last_ok_ts = time.monotonic()
+
+
+_probe = _Probe()
+
+
+@router.get("/live")
+async def live() -> dict:
+    """
+    Liveness probe; does not touch the database.
+    """
+    return {"status": "ok"}
+
+
 @router.get("/ready")
-async def ready(db: AsyncSession = Depends(get_db)) -> dict:
+async def ready() -> dict:
     """
     Readiness probe that pings the database.
     """
-    await db.execute(text("SELECT 1"))
-    return {"status": "ok"}
\ No newline at end of file
+    await _probe.check()
+    return {"status": "ok"}
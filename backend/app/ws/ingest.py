@@ -11,27 +11,290 @@ without raising RuntimeError after a client closes.
 """
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import Dict, Any
+from app.config import settings
+from collections import OrderedDict
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
 import json
+import secrets
+import struct
 import time
-import uuid
 import logging
 import os
 
+try:
+    # Optional fast JSON parser; orjson.JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 router = APIRouter(prefix="/ws", tags=["ws"])
 
-# Simple in-memory stats by connection id
-_INGEST_STATS: Dict[str, Dict[str, Any]] = {}
+
+@dataclass(slots=True)
+class ConnStats:
+    """
+    Per-connection ingestion counters and metadata.
+
+    Attributes:
+        started_at (float): Epoch seconds when the connection was accepted.
+        remote (str): Client "host:port", or "unknown".
+        total_bytes (int): Sum of binary payload sizes received.
+        frames_received (int): Number of binary frames received.
+        init (dict | None): Last 'init' payload sent by the client.
+        last_message_at (float | None): Epoch seconds of the last message
+            (refreshed every _TICK_EVERY binary frames).
+        closed (bool): Whether the connection has ended.
+        close_reason (str | None): Why the connection ended.
+    """
+    started_at: float
+    remote: str
+    total_bytes: int = 0
+    frames_received: int = 0
+    init: Optional[Dict[str, Any]] = None
+    last_message_at: Optional[float] = None
+    closed: bool = False
+    close_reason: Optional[str] = None
+
+
+# Simple in-memory stats by connection id, oldest first; capped so that
+# /ingest/stats stays small on long-running servers
+_INGEST_STATS: "OrderedDict[str, ConnStats]" = OrderedDict()
+_INGEST_STATS_MAX = 1024
+
+
+def _register_stats(conn_id: str, stats: ConnStats) -> None:
+    """
+    Add a connection's stats, evicting old entries beyond _INGEST_STATS_MAX.
+
+    Closed connections are evicted first (oldest first); active ones only
+    if every tracked connection is still open.
+
+    Args:
+        conn_id (str): Connection identifier.
+        stats (ConnStats): Stats object for the new connection.
+
+    Returns:
+        None
+    """
+    _INGEST_STATS[conn_id] = stats
+    overflow = len(_INGEST_STATS) - _INGEST_STATS_MAX
+    if overflow <= 0:
+        return
+    for cid in [cid for cid, st in _INGEST_STATS.items() if st.closed][:overflow]:
+        del _INGEST_STATS[cid]
+    while len(_INGEST_STATS) > _INGEST_STATS_MAX:
+        _INGEST_STATS.popitem(last=False)
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
 
-# Optional debug dump to file. Set to a path to write the raw webm chunks.
-_DEBUG_DUMP_PATH = r"F:\\projects\\meeting_assistant\\backend\\debug_audio.webm"
+# Warnings that can fire per frame are logged at most once per interval per key
+_WARN_INTERVAL = 5.0
+_last_warn_at: Dict[str, float] = {}
+
+
+def _warn_throttled(key: str, msg: str, *args: Any) -> None:
+    """
+    Log a warning unless the same key was logged within _WARN_INTERVAL seconds.
+
+    Args:
+        key (str): Identifies the kind of warning being throttled.
+        msg (str): Logging format string.
+        *args: Format arguments.
+
+    Returns:
+        None
+    """
+    now = time.monotonic()
+    if now - _last_warn_at.get(key, float("-inf")) >= _WARN_INTERVAL:
+        _last_warn_at[key] = now
+        logger.warning(msg, *args)
+
+# Optional debug dump of the raw webm chunks, enabled by setting INGEST_DEBUG_DUMP
+# to a path; each connection gets its own file, e.g. debug_audio_<conn_id>.webm.
+_DEBUG_DUMP_PATH: Optional[str] = settings.ingest_debug_dump or None
+_DUMP_ENABLED = _DEBUG_DUMP_PATH is not None
+_DUMP_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+_DUMP_QUEUE_SIZE = 1024      # pending frames (all connections) before the dump starts dropping
+# Chunks are batched per connection and written with one writev() once either
+# limit is hit, when the connection closes, or every _DUMP_FLUSH_INTERVAL seconds.
+_DUMP_FLUSH_BYTES = 256 * 1024
+_DUMP_FLUSH_CHUNKS = 32
+_DUMP_FLUSH_INTERVAL = 1.0
+
+# Single writer task shared by all connections; items are (conn_id, chunk),
+# chunk=None closes that connection's file, and a bare None stops the writer.
+_DumpItem = Optional[Tuple[str, Optional[bytes]]]
+_DUMP_QUEUE: Optional["asyncio.Queue[_DumpItem]"] = None
+_DUMP_TASK: Optional[asyncio.Task] = None
+
+# Per-frame bookkeeping (last_message_at, acks) runs once every _TICK_EVERY frames.
+# Must be a power of two so the check is a mask.
+_TICK_EVERY = 32
+_TICK_MASK = _TICK_EVERY - 1
+
+# Frame-count ack: one binary message holding an unsigned 64-bit little-endian int
+_ACK_FRAMES = struct.Struct("<Q")
+
+
+def _write_chunks(fd: int, chunks: List[bytes], total: int) -> None:
+    """
+    Write all chunks to fd, with a single writev() where available.
+
+    Args:
+        fd (int): Open file descriptor.
+        chunks (List[bytes]): Data to write, in order.
+        total (int): Sum of the chunk lengths.
+
+    Returns:
+        None
+    """
+    if hasattr(os, "writev"):
+        written = os.writev(fd, chunks)
+        if written == total:
+            return
+        rest = memoryview(b"".join(chunks))[written:]
+    else:
+        # Windows has no writev(); one joined write is the next best thing
+        rest = memoryview(b"".join(chunks))
+    while rest:
+        rest = rest[os.write(fd, rest):]
+
+
+@dataclass(slots=True)
+class _DumpFile:
+    """
+    One connection's debug dump file and the chunks not yet written to it.
+    The blocking methods are called via asyncio.to_thread.
+    """
+    fd: int
+    pending: List[bytes] = field(default_factory=list)
+    pending_bytes: int = 0
+
+    @classmethod
+    def open(cls, conn_id: str) -> "_DumpFile":
+        """Create (or truncate) the dump file for one connection."""
+        base = Path(_DEBUG_DUMP_PATH)
+        path = base.with_name(f"{base.stem}_{conn_id}{base.suffix}")
+        return cls(fd=os.open(path, _DUMP_OPEN_FLAGS, 0o644))
+
+    def add(self, chunk: bytes) -> bool:
+        """Queue a chunk; returns True once the batch should be flushed."""
+        self.pending.append(chunk)
+        self.pending_bytes += len(chunk)
+        return self.pending_bytes >= _DUMP_FLUSH_BYTES or len(self.pending) >= _DUMP_FLUSH_CHUNKS
+
+    def flush(self) -> None:
+        """Write pending chunks; they are discarded even if the write fails."""
+        if not self.pending:
+            return
+        try:
+            _write_chunks(self.fd, self.pending, self.pending_bytes)
+        finally:
+            self.pending.clear()
+            self.pending_bytes = 0
+
+    def close(self) -> None:
+        """Flush pending chunks and close the file."""
+        try:
+            self.flush()
+        finally:
+            os.close(self.fd)
+
+
+async def _dump_writer(queue: "asyncio.Queue[_DumpItem]") -> None:
+    """
+    Write queued chunks to per-connection debug dump files off the event loop.
+
+    Args:
+        queue (asyncio.Queue): (conn_id, chunk) items; see _DUMP_QUEUE.
+
+    Returns:
+        None
+    """
+    # conn_id -> dump file, or None if the file could not be opened
+    files: Dict[str, Optional[_DumpFile]] = {}
+    loop = asyncio.get_running_loop()
+    next_flush = loop.time() + _DUMP_FLUSH_INTERVAL
+    try:
+        while True:
+            timeout = next_flush - loop.time()
+            if timeout <= 0:
+                # Periodic flush so slow streams still reach disk
+                for df in files.values():
+                    if df is not None and df.pending:
+                        try:
+                            await asyncio.to_thread(df.flush)
+                        except OSError as e:
+                            _warn_throttled("dump_write", "debug dump write failed: %r", e)
+                next_flush = loop.time() + _DUMP_FLUSH_INTERVAL
+                continue
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                continue
+            if item is None:
+                return
+            conn_id, chunk = item
+            if chunk is None:
+                df = files.pop(conn_id, None)
+                if df is not None:
+                    try:
+                        await asyncio.to_thread(df.close)
+                    except OSError as e:
+                        logger.warning("could not close debug dump file: %r", e)
+                continue
+            if conn_id not in files:
+                try:
+                    files[conn_id] = await asyncio.to_thread(_DumpFile.open, conn_id)
+                except OSError as e:
+                    files[conn_id] = None
+                    logger.warning("could not open debug dump file: %r", e)
+            df = files[conn_id]
+            if df is None or not df.add(chunk):
+                continue
+            try:
+                await asyncio.to_thread(df.flush)
+            except OSError as e:
+                _warn_throttled("dump_write", "debug dump write failed: %r", e)
+    finally:
+        for df in files.values():
+            if df is not None:
+                try:
+                    df.close()
+                except OSError:
+                    pass
+
+
+async def start_dump_writer() -> None:
+    """
+    Start the shared debug dump writer (no-op when dumping is disabled).
+    Registered as an app startup handler.
+    """
+    global _DUMP_QUEUE, _DUMP_TASK
+    if not _DUMP_ENABLED or _DUMP_TASK is not None:
+        return
+    _DUMP_QUEUE = asyncio.Queue(maxsize=_DUMP_QUEUE_SIZE)
+    _DUMP_TASK = asyncio.create_task(_dump_writer(_DUMP_QUEUE))
+
+
+async def stop_dump_writer() -> None:
+    """
+    Flush and stop the shared debug dump writer. Registered as an app shutdown handler.
+    """
+    global _DUMP_QUEUE, _DUMP_TASK
+    if _DUMP_TASK is None:
+        return
+    await _DUMP_QUEUE.put(None)
+    await _DUMP_TASK
+    _DUMP_QUEUE = None
+    _DUMP_TASK = None
 
 
 @router.get("/ingest/stats")
-def ingest_stats() -> Dict[str, Dict[str, Any]]:
+async def ingest_stats() -> Dict[str, Dict[str, Any]]:
     """
     Return ingestion statistics for all active and recent connections.
 
@@ -40,7 +303,100 @@ def ingest_stats() -> Dict[str, Dict[str, Any]]:
               total_bytes, frames_received, started_at, last_message_at,
               and the last 'init' payload received from the client.
     """
-    return _INGEST_STATS
+    return {conn_id: asdict(stats) for conn_id, stats in _INGEST_STATS.items()}
+
+
+async def _handshake(
+    websocket: WebSocket,
+    conn_id: str,
+    stats: ConnStats,
+    message: Optional[Dict[str, Any]] = None,
+) -> Optional[bytes]:
+    """
+    Handle control messages (e.g., 'init') until binary audio starts.
+
+    Args:
+        websocket (WebSocket): The client connection.
+        conn_id (str): Connection identifier (for logging).
+        stats (ConnStats): This connection's stats.
+        message (dict | None): An already-received ASGI event to handle first.
+
+    Returns:
+        bytes | None: The first binary chunk, or None if the client disconnected.
+    """
+    while True:
+        if message is None:
+            # Receive the next ASGI event from the client
+            message = await websocket.receive()
+
+        stats.last_message_at = time.time()
+
+        # ASGI message type can help us identify disconnects explicitly
+        if message.get("type") == "websocket.disconnect":
+            stats.closed = True
+            stats.close_reason = "event:disconnect"
+            logger.info("connection closed (event disconnect): %s", conn_id)
+            return None
+
+        chunk = message.get("bytes")
+        if chunk is not None:
+            return chunk
+
+        # Text messages carry control/metadata
+        if message.get("text") is not None:
+            try:
+                payload = _json_loads(message["text"])
+                if payload.get("type") == "init":
+                    stats.init = payload
+                    await websocket.send_text("ingest:init:ok")
+                else:
+                    await websocket.send_text("ingest:unknown_text")
+            except json.JSONDecodeError:
+                await websocket.send_text("ingest:text_non_json")
+        message = None
+
+
+async def _stream(
+    websocket: WebSocket,
+    conn_id: str,
+    stats: ConnStats,
+    dump_queue: Optional["asyncio.Queue[_DumpItem]"],
+    chunk: bytes,
+) -> Dict[str, Any]:
+    """
+    Binary fast path: count (and optionally dump) audio chunks until a
+    non-binary event arrives.
+
+    Args:
+        websocket (WebSocket): The client connection.
+        conn_id (str): Connection identifier (dump file key).
+        stats (ConnStats): This connection's stats.
+        dump_queue (asyncio.Queue | None): Shared dump writer queue, if enabled.
+        chunk (bytes): The first binary chunk, already received.
+
+    Returns:
+        dict: The non-binary ASGI event that ended the stream (text or disconnect).
+    """
+    while True:
+        stats.total_bytes += len(chunk)
+        stats.frames_received += 1
+
+        # Optional debug: append to a .webm file for manual inspection
+        if dump_queue is not None:
+            try:
+                dump_queue.put_nowait((conn_id, chunk))
+            except asyncio.QueueFull:
+                _warn_throttled("dump_queue_full", "debug dump queue full; dropping frames")
+
+        # Every _TICK_EVERY frames: refresh last_message_at and ack the client
+        if not stats.frames_received & _TICK_MASK:
+            stats.last_message_at = time.time()
+            await websocket.send_bytes(_ACK_FRAMES.pack(stats.frames_received))
+
+        message = await websocket.receive()
+        chunk = message.get("bytes")
+        if chunk is None:
+            return message
 
 
 @router.websocket("/ingest")
@@ -51,7 +407,9 @@ async def ws_ingest(websocket: WebSocket) -> None:
     The client should first send a small JSON 'init' message:
         {"type":"init","format":"audio/webm;codecs=opus","timeslice_ms":500}
 
-    Subsequent messages are expected to be binary audio chunks.
+    Subsequent messages are expected to be binary audio chunks. Every
+    _TICK_EVERY chunks the server acks with a binary message containing the
+    frame count so far as a little-endian uint64.
 
     Args:
         websocket (WebSocket): The client connection.
@@ -60,97 +418,49 @@ async def ws_ingest(websocket: WebSocket) -> None:
         None
     """
     await websocket.accept()
-    conn_id = str(uuid.uuid4())
-    _INGEST_STATS[conn_id] = {
-        "total_bytes": 0,
-        "frames_received": 0,
-        "init": None,
-        "started_at": time.time(),
-        "last_message_at": None,
-        "closed": False,
-        "close_reason": None,
-        "remote": f"{websocket.client.host}:{websocket.client.port}" if websocket.client else "unknown",
-    }
+    conn_id = secrets.token_hex(16)
+    stats = ConnStats(
+        started_at=time.time(),
+        remote=f"{websocket.client.host}:{websocket.client.port}" if websocket.client else "unknown",
+    )
+    _register_stats(conn_id, stats)
 
     logger.info("connection open: %s", conn_id)
     await websocket.send_text("ingest:connected")
 
-    # Initialize debug dump if enabled
-    if _DEBUG_DUMP_PATH:
-        try:
-            # Remove existing file so each connection starts fresh
-            if os.path.exists(_DEBUG_DUMP_PATH):
-                os.remove(_DEBUG_DUMP_PATH)
-        except Exception as e:
-            logger.warning("could not reset debug dump file: %r", e)
+    # Debug dump (if enabled) goes through the shared writer task
+    dump_queue = _DUMP_QUEUE
 
+    # Alternate between control handling and the binary fast path; a text
+    # frame mid-stream is handed back to _handshake, and so on until disconnect.
+    message: Optional[Dict[str, Any]] = None
     try:
         while True:
-            try:
-                # Receive the next ASGI event from the client
-                message = await websocket.receive()
-            except WebSocketDisconnect:
-                # Normal client disconnect
-                _INGEST_STATS[conn_id]["closed"] = True
-                _INGEST_STATS[conn_id]["close_reason"] = "disconnect"
-                logger.info("connection closed (WebSocketDisconnect): %s", conn_id)
-                break
-            except RuntimeError as exc:
-                # Starlette raises this if receive() is called after disconnect
-                _INGEST_STATS[conn_id]["closed"] = True
-                _INGEST_STATS[conn_id]["close_reason"] = f"runtime:{exc}"
-                logger.info("connection closed (RuntimeError after disconnect): %s", conn_id)
-                break
-
-            _INGEST_STATS[conn_id]["last_message_at"] = time.time()
-
-            # ASGI message type can help us identify disconnects explicitly
-            msg_type = message.get("type")
-            if msg_type == "websocket.disconnect":
-                _INGEST_STATS[conn_id]["closed"] = True
-                _INGEST_STATS[conn_id]["close_reason"] = "event:disconnect"
-                logger.info("connection closed (event disconnect): %s", conn_id)
+            chunk = await _handshake(websocket, conn_id, stats, message)
+            if chunk is None:
                 break
+            message = await _stream(websocket, conn_id, stats, dump_queue, chunk)
 
-            # Text messages carry control/metadata
-            if "text" in message and message["text"] is not None:
-                try:
-                    payload = json.loads(message["text"])
-                    if payload.get("type") == "init":
-                        _INGEST_STATS[conn_id]["init"] = payload
-                        await websocket.send_text("ingest:init:ok")
-                    else:
-                        await websocket.send_text("ingest:unknown_text")
-                except json.JSONDecodeError:
-                    await websocket.send_text("ingest:text_non_json")
-                continue
-
-            # Binary messages carry audio data
-            if "bytes" in message and message["bytes"] is not None:
-                chunk: bytes = message["bytes"]
-                _INGEST_STATS[conn_id]["total_bytes"] += len(chunk)
-                _INGEST_STATS[conn_id]["frames_received"] += 1
-
-                # Optional debug: append to a .webm file for manual inspection
-                if _DEBUG_DUMP_PATH:
-                    try:
-                        with open(_DEBUG_DUMP_PATH, "ab") as f:
-                            f.write(chunk)
-                    except Exception as e:
-                        logger.warning("debug dump write failed: %r", e)
-
-                # Occasional ack to client
-                if _INGEST_STATS[conn_id]["frames_received"] % 20 == 0:
-                    await websocket.send_text(
-                        f"ingest:frames={_INGEST_STATS[conn_id]['frames_received']}"
-                    )
-
+    except WebSocketDisconnect:
+        # Normal client disconnect
+        stats.closed = True
+        stats.close_reason = "disconnect"
+        logger.info("connection closed (WebSocketDisconnect): %s", conn_id)
+    except RuntimeError as exc:
+        # Starlette raises this if receive() is called after disconnect
+        stats.closed = True
+        stats.close_reason = f"runtime:{exc}"
+        logger.info("connection closed (RuntimeError after disconnect): %s", conn_id)
     except Exception as exc:
         # Unexpected error path
-        _INGEST_STATS[conn_id]["closed"] = True
-        _INGEST_STATS[conn_id]["close_reason"] = f"error:{exc!r}"
+        stats.closed = True
+        stats.close_reason = f"error:{exc!r}"
         logger.exception("WebSocket error for %s: %r", conn_id, exc)
         try:
             await websocket.close()
         except Exception:
             pass
+    finally:
+        if dump_queue is not None:
+            # Blocking put: the close marker must not be dropped
+            await dump_queue.put((conn_id, None))
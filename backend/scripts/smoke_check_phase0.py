@@ -15,13 +15,19 @@ BACKEND_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if BACKEND_ROOT not in sys.path:
     sys.path.insert(0, BACKEND_ROOT)
 
-from typing import List
+from typing import FrozenSet, List, Optional
+import asyncio
+import atexit
 import sys
 from sqlalchemy import inspect
-from app.db import engine
-from app.main import app  # noqa: F401  # importing ensures metadata is created
+from app.db import get_engine
+from app.main import app  # noqa: F401  # import check only; schema is owned by Alembic
 import httpx
 
+# Shared client so repeated checks reuse the pooled keep-alive connection
+_CLIENT = httpx.Client(base_url="http://127.0.0.1:8000", timeout=5.0)
+atexit.register(_CLIENT.close)
+
 def _check_imports() -> List[str]:
     """
     Checks importability of core modules.
@@ -41,7 +47,43 @@ def _check_imports() -> List[str]:
         errors.append(f"Import error: {exc!r}")
     return errors
 
-def _check_db() -> List[str]:
+# Table names per process; the schema doesn't change between checks
+_TABLES: Optional[FrozenSet[str]] = None
+
+async def _tables() -> FrozenSet[str]:
+    """
+    Lists table names through the app's async engine (cached after the first call).
+
+    Args:
+        None
+
+    Returns:
+        FrozenSet[str]: Names of the tables visible on the default schema.
+    """
+    global _TABLES
+    if _TABLES is None:
+        engine = get_engine()
+        try:
+            async with engine.connect() as conn:
+                _TABLES = frozenset(await conn.run_sync(lambda c: inspect(c).get_table_names()))
+        finally:
+            await engine.dispose()
+    return _TABLES
+
+def _tables_cache_clear() -> None:
+    """
+    Forgets the cached table names (e.g., after a migration changes the schema).
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    global _TABLES
+    _TABLES = None
+
+async def _check_db() -> List[str]:
     """
     Checks database connectivity and required tables.
 
@@ -53,10 +95,8 @@ def _check_db() -> List[str]:
     """
     errors: List[str] = []
     try:
-        inspector = inspect(engine)
-        tables = set(inspector.get_table_names())
         required = {"meetings", "utterances"}
-        missing = required - tables
+        missing = required - await _tables()
         if missing:
             errors.append(f"Missing tables: {sorted(missing)}")
     except Exception as exc:
@@ -75,7 +115,7 @@ def _check_http() -> List[str]:
     """
     errors: List[str] = []
     try:
-        resp = httpx.get("http://127.0.0.1:8000/health/ready", timeout=5.0)
+        resp = _CLIENT.get("/health/ready")
         if resp.status_code != 200:
             errors.append(f"Health status code: {resp.status_code}")
         else:
@@ -86,9 +126,9 @@ def _check_http() -> List[str]:
         errors.append(f"HTTP error: {exc!r}")
     return errors
 
-def main() -> None:
+async def main() -> None:
     """
-    Runs all smoke checks and prints a summary.
+    Runs all smoke checks concurrently and prints a summary.
 
     Args:
         None
@@ -96,10 +136,12 @@ def main() -> None:
     Returns:
         None
     """
-    overall_errors: List[str] = []
-    overall_errors += _check_imports()
-    overall_errors += _check_db()
-    overall_errors += _check_http()
+    results = await asyncio.gather(
+        asyncio.to_thread(_check_imports),
+        _check_db(),
+        asyncio.to_thread(_check_http),
+    )
+    overall_errors: List[str] = [e for errors in results for e in errors]
 
     if overall_errors:
         print("Smoke check FAILED")
@@ -110,4 +152,4 @@ def main() -> None:
         print("Smoke check PASSED")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
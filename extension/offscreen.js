@@ -73,7 +73,7 @@ async function start(wsUrl, streamId) {
 // 2) Open backend WebSocket
   ws = await openSocket(wsUrl);
   ws.onmessage = (event) => {
-    // Backend may send acknowledgements (e.g., ingest:frames=20)
+    // Backend may send acknowledgements (binary: uint64 LE frame count every 32 frames)
     // Useful for debugging; no action required here.
     // console.log("Backend:", event.data);
   };